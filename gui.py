@@ -5,9 +5,21 @@ import json
 import queue
 import threading
 import subprocess
-from ftplib import FTP
+import concurrent.futures
+import selectors
+import signal
+import socket
+from ftplib import FTP, all_errors
 from pathlib import Path
 import re
+import weakref
+import hashlib
+import functools
+import tempfile
+import collections
+
+if os.name == 'nt':
+    import msvcrt
 
 # Check if pip is installed
 def check_pip():
@@ -24,13 +36,31 @@ def install_requirements():
         # Get the directory containing this script
         script_dir = os.path.dirname(os.path.abspath(__file__))
         requirements_path = os.path.join(script_dir, "requirements.txt")
-        
-        if os.path.exists(requirements_path):
-            print("Installing requirements...")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", requirements_path])
-            print("Requirements installed successfully!")
-        else:
+        stamp_path = os.path.join(script_dir, ".requirements.stamp")
+
+        if not os.path.exists(requirements_path):
             print("requirements.txt not found!")
+            return
+
+        with open(requirements_path, 'rb') as f:
+            req_hash = hashlib.blake2b(f.read()).hexdigest()
+
+        # Skip pip entirely when this exact requirements.txt was already
+        # installed by a previous launch (pip resolution alone takes seconds);
+        # set ISO2GOD_FORCE_INSTALL to reinstall anyway
+        if not os.environ.get("ISO2GOD_FORCE_INSTALL"):
+            try:
+                with open(stamp_path) as f:
+                    if f.read().strip() == req_hash:
+                        return
+            except OSError:
+                pass
+
+        print("Installing requirements...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", requirements_path])
+        print("Requirements installed successfully!")
+        with open(stamp_path, 'w') as f:
+            f.write(req_hash)
     except Exception as e:
         print(f"Error installing requirements: {str(e)}")
         sys.exit(1)
@@ -73,15 +103,108 @@ DEFAULT_CONFIG = {
     "drv_name": ""
 }
 
+# Everything a transfer attempt can throw: network errors plus a bad port
+# string (int() in _open_ftp_connection). A miss here would kill the worker.
+_FTP_ERRORS = all_errors + (ValueError,)
+
+class _TunedFTP(FTP):
+    """FTP session that applies the bulk-transfer socket options to each
+    data connection. storbinary moves the bytes over a fresh data socket per
+    transfer, so tuning the control socket would never touch the bulk path."""
+
+    SNDBUF = 4 * 1024 * 1024
+
+    def ntransfercmd(self, cmd, rest=None):
+        conn, size = super().ntransfercmd(cmd, rest)
+        # Disable Nagle and widen the send buffer for bulk transfers
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SNDBUF)
+        return conn, size
+
+# Accept patterns like windows-1.6.0, mac-1.6.0, linux-1.6.0, with or without .exe/.bin/.sh
+_BIN_RE = re.compile(r'^(windows|mac|linux)-[\d.]+(\.[a-zA-Z0-9]+)?$')
+
+def _check_iso_ready(iso_path):
+    """Probe whether an ISO is settled enough to convert, without opening it
+    for read (a real open can block for seconds on slow network shares).
+
+    Raises PermissionError when the file is still locked by its writer
+    (Windows) or still growing (a copy landing on POSIX).
+    """
+    if os.name == 'nt':
+        # A non-blocking byte lock fails while another process holds the file
+        fd = os.open(iso_path, os.O_RDONLY | os.O_BINARY)
+        try:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            except OSError as e:
+                raise PermissionError(f"{iso_path} is locked: {e}")
+        finally:
+            os.close(fd)
+    else:
+        # Two stats half a second apart; a changing size means the writer
+        # hasn't finished yet
+        size = os.stat(iso_path).st_size
+        time.sleep(0.5)
+        if os.stat(iso_path).st_size != size or size == 0:
+            raise PermissionError(f"{iso_path} is still being written")
+
+# One DFA pass over each batched read of child output, instead of several
+# Python-level substring scans per line
+_MARKER_RE = re.compile(
+    rb"(?P<j>unexpected argument '-j' found)"
+    rb"|(?P<perm>process cannot access the file|being used by another process)"
+    rb"|(?P<part>writing part files:)"
+)
+
+_VERSION_RE = re.compile(r'-(\d+\.\d+\.\d+)')
+
+@functools.lru_cache(maxsize=32)
+def _is_legacy_version(binary_name):
+    """iso2god v1.6.0 and below don't understand the -j flag."""
+    m = _VERSION_RE.search(binary_name)
+    if m:
+        # Compare as tuple of ints
+        return tuple(map(int, m.group(1).split('.'))) <= (1, 6, 0)
+    return False
+
+def _ver_key(name):
+    """Sort key for natural version ordering (1.10.0 after 1.6.0)."""
+    m = _VERSION_RE.search(name)
+    return tuple(map(int, m.group(1).split('.'))) if m else (0,)
+
+@functools.lru_cache(maxsize=4)
+def _read_config(path, mtime_ns):
+    """Parse the config file once per on-disk version."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+@functools.lru_cache(maxsize=8)
+def _scan_binaries(dir_mtime_ns):
+    """Scan ISO2GOD_DIR once per directory mtime; cached until the folder changes."""
+    binaries = []
+    with os.scandir(ISO2GOD_DIR) as it:
+        for entry in it:
+            if entry.is_file() and _BIN_RE.match(entry.name):
+                binaries.append(entry.name)
+    # Newest version first, so it becomes the default selection
+    return tuple(sorted(binaries, key=_ver_key, reverse=True))
+
 class IsoHandler(FileSystemEventHandler):
-    def __init__(self, queue, extensions=('.iso',)):
+    # Hard ceiling on tracked paths so an event flood can't grow state unbounded
+    MAX_PENDING = 1024
+
+    # Both cases listed so endswith() can test in C without a per-event
+    # .lower() allocation
+    def __init__(self, enqueue, extensions=('.iso', '.ISO')):
         super().__init__()
-        self.queue = queue
+        self.enqueue = enqueue
         self.extensions = extensions
         self.processing = set()
-        self.last_event_time = {}
         self.scan_delay = 2.0  # Default delay
-        self._stop_event = threading.Event()
+        self._pending_timers = collections.OrderedDict()
+        self._timers_lock = threading.Lock()
 
     def set_scan_delay(self, delay):
         try:
@@ -90,59 +213,51 @@ class IsoHandler(FileSystemEventHandler):
             self.scan_delay = 2.0
 
     def on_created(self, event):
-        if not event.is_directory and event.src_path.lower().endswith(self.extensions):
-            current_time = time.time()
-            
-            # Check if we've seen this file before and if enough time has passed
-            if event.src_path in self.last_event_time:
-                if current_time - self.last_event_time[event.src_path] < self.scan_delay:
-                    return  # Not enough time has passed
-            
-            self.last_event_time[event.src_path] = current_time
-            
-            if event.src_path not in self.processing:
-                self.queue.put(event.src_path)
-                self.processing.add(event.src_path)
-
-class DirectoryWatcher(threading.Thread):
-    def __init__(self, path, handler):
-        super().__init__(daemon=True)
-        self.path = path
-        self.handler = handler
-        self._stop_event = threading.Event()
-        self._last_check = {}
+        if not event.is_directory and event.src_path.endswith(self.extensions):
+            self._schedule_flush(event.src_path)
+
+    def on_moved(self, event):
+        # Files dragged or renamed into the watch directory arrive as move
+        # events rather than create events
+        if event.is_directory:
+            return
+        # A rename also invalidates any debounce pending under the old name
+        if event.src_path.endswith(self.extensions):
+            with self._timers_lock:
+                timer = self._pending_timers.pop(event.src_path, None)
+                if timer is not None:
+                    timer.cancel()
+        if event.dest_path.endswith(self.extensions):
+            self._schedule_flush(event.dest_path)
+
+    def _schedule_flush(self, path):
+        """Trailing-edge debounce: restart the timer on every event so a
+        burst of events for the same file queues it only once."""
+        with self._timers_lock:
+            timer = self._pending_timers.pop(path, None)
+            if timer is not None:
+                timer.cancel()
+            timer = threading.Timer(self.scan_delay, self._flush, args=(path,))
+            timer.daemon = True
+            self._pending_timers[path] = timer
+            while len(self._pending_timers) > self.MAX_PENDING:
+                _, oldest = self._pending_timers.popitem(last=False)
+                oldest.cancel()
+            timer.start()
+
+    def _flush(self, path):
+        with self._timers_lock:
+            self._pending_timers.pop(path, None)
+        if path not in self.processing:
+            self.processing.add(path)
+            self.enqueue(path)
 
     def stop(self):
-        self._stop_event.set()
-
-    def check_directory(self):
-        try:
-            current_files = set()
-            for file in os.listdir(self.path):
-                if file.lower().endswith('.iso'):
-                    filepath = os.path.join(self.path, file)
-                    current_files.add(filepath)
-                    
-                    # Check if this is a new file or if enough time has passed since last check
-                    current_time = time.time()
-                    if filepath not in self._last_check:
-                        self._last_check[filepath] = current_time
-                        # Simulate a file creation event
-                        event = FileCreatedEvent(filepath)
-                        self.handler.on_created(event)
-            
-            # Clean up old files from last_check
-            for filepath in list(self._last_check.keys()):
-                if filepath not in current_files:
-                    del self._last_check[filepath]
-                    
-        except Exception as e:
-            print(f"Error checking directory: {e}")
-
-    def run(self):
-        while not self._stop_event.is_set():
-            self.check_directory()
-            time.sleep(1)  # Check every second
+        """Cancel any debounce timers still pending."""
+        with self._timers_lock:
+            for timer in self._pending_timers.values():
+                timer.cancel()
+            self._pending_timers.clear()
 
 class Iso2GodGUI:
     def __init__(self):
@@ -163,9 +278,47 @@ class Iso2GodGUI:
         self.style.configure('TButton', padding=5)
         self.style.configure('TLabel', padding=5)
         
-        # Queue for ISO files
-        self.iso_queue = queue.Queue()
-        
+        # Queue for ISO files. Single producer (handler) / single consumer
+        # (process thread): deque.append/popleft are atomic in CPython, so
+        # only the consumer wakeup needs an Event - no mutex per operation
+        self.iso_deque = collections.deque()
+        self.iso_event = threading.Event()
+        # Mirrors is_processing for the consumer thread: set while watching,
+        # cleared by Stop Watching so the drain pauses instead of converting
+        # (and FTP-uploading) ISOs the user just halted
+        self._processing_event = threading.Event()
+
+        # Progress counters (qsize() is unreliable and takes a lock per call)
+        self._count_lock = threading.Lock()
+        self._enqueued = 0
+        self._completed = 0
+
+        # Pending log lines, flushed into the text widget in one batch per
+        # mainloop tick instead of three Tcl roundtrips per message
+        self._status_buffer = collections.deque(maxlen=1000)
+        self._status_flush_scheduled = False
+
+        # Pending debounced config save (after() id)
+        self._save_after_id = None
+
+        # Conversion output crosses from the reader threads to the GUI
+        # through this queue, drained in batches on a Tk timer
+        self._log_q = queue.Queue()
+
+        # Control connection reused across FTP transfers (lazily opened).
+        # The lock serializes whole transfers: a scheduled retry and the next
+        # item's transfer must not interleave commands on the shared socket
+        self._ftp_conn = None
+        self._ftp_lock = threading.Lock()
+
+        # Small pool for fire-and-forget filesystem work (ISO deletion)
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+        # Set at shutdown so worker waits (retry backoffs) end immediately
+        # instead of holding the process for up to two minutes
+        self._stop_event = threading.Event()
+
+
         # Processing flag
         self.is_processing = False
         self.watcher = None
@@ -187,48 +340,49 @@ class Iso2GodGUI:
         
         # Create GUI elements
         self.create_widgets()
-        
+
+        # Reader threads fire this after queueing output; the drain then
+        # happens on the main thread when the event loop naturally pumps,
+        # so there are no wakeups while the child is quiet
+        self.app.bind("<<StatusUpdate>>", self._on_status_event)
+
+
         # Start the processing thread
         self.process_thread = threading.Thread(target=self.process_queue, daemon=True)
         self.process_thread.start()
 
-        # Add periodic check for GUI responsiveness
-        self.check_gui_responsive()
-
         # Show warning about missing iso2god binaries after all widgets are created
         if not self.iso2god_binaries:
             self.update_status("Warning: No iso2god binaries found in ./iso2god folder!", "error")
 
-    def check_gui_responsive(self):
-        """Periodic check to keep GUI responsive"""
-        self.app.after(100, self.check_gui_responsive)
-
     def find_iso2god_binaries(self):
         """Scan iso2god directory for binaries named <os>-<version>[.ext]"""
-        binaries = []
         if not os.path.exists(ISO2GOD_DIR):
-            return binaries
-        # Accept patterns like windows-1.6.0, mac-1.6.0, linux-1.6.0, with or without .exe/.bin/.sh
-        pattern = re.compile(r'^(windows|mac|linux)-[\d.]+(\.[a-zA-Z0-9]+)?$')
-        for fname in os.listdir(ISO2GOD_DIR):
-            fpath = os.path.join(ISO2GOD_DIR, fname)
-            if os.path.isfile(fpath):
-                if pattern.match(fname):
-                    binaries.append(fname)
-        return sorted(binaries)
+            return []
+        return list(_scan_binaries(os.stat(ISO2GOD_DIR).st_mtime_ns))
 
     def load_config(self):
         try:
             if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, 'r') as f:
-                    loaded_config = json.load(f)
-                    config = DEFAULT_CONFIG.copy()
-                    config.update(loaded_config)
-                    return config
+                loaded_config = _read_config(CONFIG_FILE, os.stat(CONFIG_FILE).st_mtime_ns)
+                config = DEFAULT_CONFIG.copy()
+                config.update(loaded_config)
+                return config
         except Exception as e:
             self.update_status(f"Error loading config: {e}", "error")
         return DEFAULT_CONFIG.copy()
 
+    def _schedule_save(self):
+        """Coalesce bursts of widget edits into a single disk write 500ms
+        after the last change."""
+        if self._save_after_id:
+            self.app.after_cancel(self._save_after_id)
+        self._save_after_id = self.app.after(500, self._flush_save)
+
+    def _flush_save(self):
+        self._save_after_id = None
+        self.save_config()
+
     def save_config(self):
         config = {
             "watch_dir": self.watch_path.get(),
@@ -247,8 +401,17 @@ class Iso2GodGUI:
             "drv_name": self.drv_field.get()
         }
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=4)
+            # Write to a temp file in the same directory and swap it in, so a
+            # crash mid-write never leaves a truncated config behind
+            fd, tmp_path = tempfile.mkstemp(dir=SCRIPT_DIR, prefix=".watcher_config.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(config, f, indent=4)
+                os.replace(tmp_path, CONFIG_FILE)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
         except Exception as e:
             self.update_status(f"Error saving config: {e}", "error")
 
@@ -287,7 +450,7 @@ class Iso2GodGUI:
         ttk.Label(iso2god_frame, text="iso2god Version:").pack(side="left")
         self.iso2god_dropdown = ttk.Combobox(iso2god_frame, textvariable=self.selected_iso2god, values=self.iso2god_binaries, state="readonly", width=40)
         self.iso2god_dropdown.pack(side="left", padx=5, fill="x", expand=True)
-        self.iso2god_dropdown.bind("<<ComboboxSelected>>", lambda e: self.save_config())
+        self.iso2god_dropdown.bind("<<ComboboxSelected>>", lambda e: self._schedule_save())
 
         # Settings Frame
         settings_frame = ttk.Frame(main_container)
@@ -344,77 +507,11 @@ class Iso2GodGUI:
         ftp_frame = ttk.Frame(main_container)
         ftp_frame.pack(fill="x", pady=5)
 
-        self.ftp_ip = ttk.Entry(ftp_frame, width=15)
-        self.ftp_ip.pack(side="left", fill="x", padx=5)
-        ip_address = self.config.get("ip_addr", "IP Address") or "IP Address"
-        self.ftp_ip.insert(0, ip_address)
-        self.ftp_ip.config(foreground="gray" if ip_address == "IP Address" else "black")
-        self.ftp_ip.bind("<FocusIn>", lambda e: (
-            self.ftp_ip.delete(0, tk.END) if self.ftp_ip.get() == "IP Address" else None,
-            self.ftp_ip.config(foreground="black")
-        ))
-        self.ftp_ip.bind("<FocusOut>", lambda e: (
-            self.ftp_ip.insert(0, "IP Address") if not self.ftp_ip.get() else None,
-            self.ftp_ip.config(foreground="gray" if self.ftp_ip.get() == "IP Address" else "black")
-        ))
-
-        self.ftp_user = ttk.Entry(ftp_frame, width=20)
-        self.ftp_user.pack(side="left", fill="x", padx=5)
-        user_value = self.config.get("ftp_user", "Username") or "Username"
-        self.ftp_user.insert(0, user_value)
-        self.ftp_user.config(foreground="gray" if user_value == "Username" else "black")
-        self.ftp_user.bind("<FocusIn>", lambda e: (
-            self.ftp_user.delete(0, tk.END) if self.ftp_user.get() == "Username" else None,
-            self.ftp_user.config(foreground="black")
-        ))
-        self.ftp_user.bind("<FocusOut>", lambda e: (
-            self.ftp_user.insert(0, "Username") if not self.ftp_user.get() else None,
-            self.ftp_user.config(foreground="gray" if self.ftp_user.get() == "Username" else "black")
-        ))
-
-        self.ftp_pass = ttk.Entry(ftp_frame)
-        self.ftp_pass.pack(side="left", fill="x", padx=5)
-        pass_value = self.config.get("ftp_pass", "Password") or "Password"
-        self.ftp_pass.insert(0, pass_value)
-        self.ftp_pass.config(foreground="gray" if self.ftp_pass.get() == "Password" else "black",
-                                show="" if self.ftp_pass.get() == "Password" else "*")
-        self.ftp_pass.bind("<FocusIn>", lambda e: (
-            self.ftp_pass.delete(0, tk.END) if self.ftp_pass.get() == "Password" else None,
-            self.ftp_pass.config(foreground="black", show="*" if self.ftp_pass.get() != "Password" else "")
-        ))
-        self.ftp_pass.bind("<FocusOut>", lambda e: (
-            self.ftp_pass.insert(0, "Password") if not self.ftp_pass.get() else None,
-            self.ftp_pass.config(foreground="gray" if self.ftp_pass.get() == "Password" else "black",
-                                show="" if self.ftp_pass.get() == "Password" else "*")
-        ))
-
-        self.ftp_port = ttk.Entry(ftp_frame, width=17)
-        self.ftp_port.pack(side="left", fill="x", padx=5)
-        port_value = self.config.get("ftp_port", "Port (default: 21)") or "Port (default: 21)"
-        self.ftp_port.insert(0, port_value)
-        self.ftp_port.config(foreground="gray" if port_value == "Port (default: 21)" else "black")
-        self.ftp_port.bind("<FocusIn>", lambda e: (
-            self.ftp_port.delete(0, tk.END) if self.ftp_port.get() == "Port (default: 21)" else None,
-            self.ftp_port.config(foreground="black")
-        ))
-        self.ftp_port.bind("<FocusOut>", lambda e: (
-            self.ftp_port.insert(0, "Port (default: 21)") if not self.ftp_port.get() else None,
-            self.ftp_port.config(foreground="gray" if self.ftp_port.get() == "Port (default: 21)" else "black")
-        ))
-
-        self.drv_field = ttk.Entry(ftp_frame, width=30)
-        self.drv_field.pack(side="left", fill="x", padx=5)
-        user_value = self.config.get("drv_name", "Drive Folder (default: Hdd1)") or "Drive Folder (default: Hdd1)"
-        self.drv_field.insert(0, user_value)
-        self.drv_field.config(foreground="gray" if user_value == "Drive Folder (default: Hdd1)" else "black")
-        self.drv_field.bind("<FocusIn>", lambda e: (
-            self.drv_field.delete(0, tk.END) if self.drv_field.get() == "Drive Folder (default: Hdd1)" else None,
-            self.drv_field.config(foreground="black")
-        ))
-        self.drv_field.bind("<FocusOut>", lambda e: (
-            self.drv_field.insert(0, "Drive Folder (default: Hdd1)") if not self.drv_field.get() else None,
-            self.drv_field.config(foreground="gray" if self.drv_field.get() == "Drive Folder (default: Hdd1)" else "black")
-        ))
+        self.ftp_ip = self._make_placeholder_entry(ftp_frame, 15, "IP Address", self.config.get("ip_addr", ""))
+        self.ftp_user = self._make_placeholder_entry(ftp_frame, 20, "Username", self.config.get("ftp_user", ""))
+        self.ftp_pass = self._make_placeholder_entry(ftp_frame, None, "Password", self.config.get("ftp_pass", ""), show_char="*")
+        self.ftp_port = self._make_placeholder_entry(ftp_frame, 17, "Port (default: 21)", self.config.get("ftp_port", ""))
+        self.drv_field = self._make_placeholder_entry(ftp_frame, 30, "Drive Folder (default: Hdd1)", self.config.get("drv_name", ""))
 
         # Current Game Title Display (Read-only)
         game_frame = ttk.Frame(main_container)
@@ -450,67 +547,169 @@ class Iso2GodGUI:
         self.status_text.configure(state="disabled")
 
 
-    ftp = FTP()
-
-    def upload_file_with_progress(self, local_path, remote_name):
+    def _make_placeholder_entry(self, parent, width, placeholder, initial, show_char=None):
+        """Build an Entry with gray placeholder text, wired to the shared
+        focus handlers instead of a fresh pair of lambdas per widget."""
+        entry = ttk.Entry(parent, width=width) if width else ttk.Entry(parent)
+        entry.pack(side="left", fill="x", padx=5)
+        value = initial or placeholder
+        entry.insert(0, value)
+        entry.placeholder = placeholder
+        entry.show_char = show_char
+        is_placeholder = value == placeholder
+        entry.config(foreground="gray" if is_placeholder else "black")
+        if show_char:
+            entry.config(show="" if is_placeholder else show_char)
+        entry.bind("<FocusIn>", self._placeholder_focus_in)
+        entry.bind("<FocusOut>", self._placeholder_focus_out)
+        return entry
+
+    def _placeholder_focus_in(self, event):
+        entry = event.widget
+        if entry.get() == entry.placeholder:
+            entry.delete(0, tk.END)
+        entry.config(foreground="black")
+        if entry.show_char:
+            entry.config(show=entry.show_char)
+
+    def _placeholder_focus_out(self, event):
+        entry = event.widget
+        if not entry.get():
+            entry.insert(0, entry.placeholder)
+        is_placeholder = entry.get() == entry.placeholder
+        entry.config(foreground="gray" if is_placeholder else "black")
+        if entry.show_char:
+            entry.config(show="" if is_placeholder else entry.show_char)
+
+    # 1 MiB blocks keep large uploads link-bound instead of syscall-bound
+    FTP_BLOCK_SIZE = 1024 * 1024
+    # A single FTP socket is not safe to share across threads, so each upload
+    # worker owns its own connection
+    FTP_WORKERS = 4
+
+    def _open_ftp_connection(self):
+        """Connect and log in a fresh session; _TunedFTP tunes each data
+        socket as it is created."""
+        ftp = _TunedFTP()
+        ftp.connect(self.ftp_ip.get(), 21 if self.ftp_port.get() == "Port (default: 21)" else int(self.ftp_port.get()))
+        ftp.login(self.ftp_user.get(), self.ftp_pass.get())
+        return ftp
+
+    def _get_ftp_conn(self):
+        """Reuse one logged-in control connection across queue items,
+        reconnecting only when the cached one has gone stale."""
+        if self._ftp_conn is not None:
+            try:
+                self._ftp_conn.voidcmd("NOOP")
+                return self._ftp_conn
+            except Exception:
+                self._ftp_conn = None
+        self._ftp_conn = self._open_ftp_connection()
+        return self._ftp_conn
+
+    def upload_file_with_progress(self, ftp, local_path, remote_path):
         total_size = os.path.getsize(local_path)
         uploaded = 0
         last_percent = 0
+        last_reported = 0
 
         def callback(data):
             nonlocal uploaded
             nonlocal last_percent
+            nonlocal last_reported
             uploaded += len(data)
+            # Skip status churn for sub-MiB increments
+            if uploaded - last_reported < self.FTP_BLOCK_SIZE:
+                return
             percent = int(uploaded / total_size * 100)
             if percent >= last_percent + 10:
                 last_percent = (percent // 10) * 10
-                self.update_status(f"\rUploading {remote_name}: {percent:.2f}%")
+                last_reported = uploaded
+                self.update_status(f"\rUploading {os.path.basename(remote_path)}: {percent:.2f}%")
 
-        with open(local_path, "rb") as f:
-            self.ftp.storbinary(f"STOR {remote_name}", f, 1024, callback=callback)
-
-    def upload_folder(self, local_dir, remote_dir):
-        try:
-            self.ftp.mkd(remote_dir)
-        except:
-            pass
-        self.ftp.cwd(remote_dir)
-
-        for item in os.listdir(local_dir):
-            local_path = os.path.join(local_dir, item)
-            if os.path.isdir(local_path):
-                self.upload_folder(local_path, item)
-                self.ftp.cwd("..")
-            else:
-                self.upload_file_with_progress(local_path, item)
-
-        self.update_status("FTP Transfer Complete!")
+        with open(local_path, "rb", buffering=self.FTP_BLOCK_SIZE) as f:
+            ftp.storbinary(f"STOR {remote_path}", f, self.FTP_BLOCK_SIZE, callback=callback)
 
     def send_over_ftp(self):
-        self.ftp.connect(self.ftp_ip.get(), 21 if self.ftp_port.get() == "Port (default: 21)" else int(self.ftp_port.get()))
-        self.ftp.login(self.ftp_user.get(), self.ftp_pass.get())
-        local_folder = self.output_path.get()     
-        remote_folder = ("Hdd1" if self.drv_field.get() == "Drive Folder (default: Hdd1)" else self.drv_field.get())+"/Content/0000000000000000"
+        # Held for the whole transfer (including _get_ftp_conn): a retry
+        # firing while the next item's transfer starts must queue behind it,
+        # not interleave NOOP/MKD on the shared control socket
+        with self._ftp_lock:
+            local_folder = self.output_path.get()
+            remote_root = ("Hdd1" if self.drv_field.get() == "Drive Folder (default: Hdd1)" else self.drv_field.get())+"/Content/0000000000000000"
+
+            # Walk the tree once, collecting remote directories and files
+            remote_dirs = [remote_root]
+            files = []
+            for dirpath, dirnames, filenames in os.walk(local_folder):
+                rel = os.path.relpath(dirpath, local_folder)
+                remote_dir = remote_root if rel == "." else remote_root + "/" + rel.replace(os.sep, "/")
+                if remote_dir != remote_root:
+                    remote_dirs.append(remote_dir)
+                for name in filenames:
+                    files.append((os.path.join(dirpath, name), remote_dir + "/" + name))
+
+            # Create every remote directory up-front on the shared control
+            # connection so the workers never race on MKD; the connection
+            # stays open for the next queue item
+            ctrl = self._get_ftp_conn()
+            for remote_dir in remote_dirs:
+                try:
+                    ctrl.mkd(remote_dir)
+                except Exception:
+                    pass  # already exists
+
+            tls = threading.local()
+            connections = []
+            conn_lock = threading.Lock()
+
+            def upload(local_path, remote_path):
+                ftp = getattr(tls, 'ftp', None)
+                if ftp is None:
+                    ftp = self._open_ftp_connection()
+                    tls.ftp = ftp
+                    with conn_lock:
+                        connections.append(ftp)
+                self.upload_file_with_progress(ftp, local_path, remote_path)
+
+            # Small GOD header files ride alongside the big data file instead
+            # of queueing behind it on one control connection
+            try:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=self.FTP_WORKERS) as pool:
+                    futures = [pool.submit(upload, lp, rp) for lp, rp in files]
+                    for fut in concurrent.futures.as_completed(futures):
+                        fut.result()
+            finally:
+                for ftp in connections:
+                    try:
+                        ftp.quit()
+                    except Exception:
+                        pass
 
-        self.upload_folder(local_folder, remote_folder)
+        self.update_status("FTP Transfer Complete!")
 
     def browse_watch_dir(self):
         directory = filedialog.askdirectory()
         if directory:
             self.watch_path.delete(0, "end")
             self.watch_path.insert(0, directory)
-            self.save_config()
+            self._schedule_save()
 
     def browse_output_dir(self):
         directory = filedialog.askdirectory()
         if directory:
             self.output_path.delete(0, "end")
             self.output_path.insert(0, directory)
-            self.save_config()
+            self._schedule_save()
 
     def update_status(self, message, status_type=None, current_index=None, total_count=None):
         """Update both the status bar and the status text area, with optional queue info"""
-        self.status_text.configure(state="normal")
+        # Tk widgets may only be touched from the main thread; worker threads
+        # (conversion, FTP, debounce timers) re-enter here via the event loop
+        if threading.current_thread() is not threading.main_thread():
+            self.app.after(0, lambda: self.update_status(message, status_type, current_index, total_count))
+            return
+
         timestamp = time.strftime("%H:%M:%S")
 
         # Add queue info to the message if provided
@@ -530,13 +729,28 @@ class Iso2GodGUI:
         else:
             self.status_label.configure(text=f"Status: {message}{queue_info}")
 
-        # Add message to text area with appropriate tag
-        if status_type:
-            self.status_text.insert("end", f"{timestamp} - ", "")
-            self.status_text.insert("end", f"{message}{queue_info}\n", status_type)
-        else:
-            self.status_text.insert("end", f"{timestamp} - {message}{queue_info}\n")
-
+        # Queue the log line; the batch lands in the text widget on the next
+        # idle tick
+        self._status_buffer.append((f"{timestamp} - {message}{queue_info}\n", status_type))
+        if not self._status_flush_scheduled:
+            self._status_flush_scheduled = True
+            self.app.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Insert all pending log lines in a single Tcl call, then tag the
+        message bodies (everything after the 11-char timestamp prefix)."""
+        self._status_flush_scheduled = False
+        if not self._status_buffer:
+            return
+        pending = []
+        while self._status_buffer:
+            pending.append(self._status_buffer.popleft())
+        self.status_text.configure(state="normal")
+        start_line = int(self.status_text.index("end-1c").split(".")[0])
+        self.status_text.insert("end", "".join(line for line, _ in pending))
+        for offset, (line, tag) in enumerate(pending):
+            if tag:
+                self.status_text.tag_add(tag, f"{start_line + offset}.11", f"{start_line + offset}.end")
         self.status_text.see("end")
         self.status_text.configure(state="disabled")
 
@@ -557,7 +771,7 @@ class Iso2GodGUI:
                 # Save current settings
                 self.save_config()
 
-                self.handler = IsoHandler(self.iso_queue)
+                self.handler = IsoHandler(self._enqueue_iso)
                 
                 # Update scan delay from UI
                 try:
@@ -569,12 +783,18 @@ class Iso2GodGUI:
                     self.scan_delay.insert(0, "2")
                     self.handler.set_scan_delay(2.0)
 
-                self.watcher = DirectoryWatcher(watch_dir, self.handler)
+                self.watcher = Observer()
+                self.watcher.schedule(self.handler, watch_dir, recursive=False)
                 self.watcher.start()
-                
+
+                # The observer only reports new files, so queue any ISOs
+                # already sitting in the watch directory
+                self.scan_existing(watch_dir)
+
                 self.start_btn.configure(text="Stop Watching")
                 self.update_status(watch_dir, "watching")
                 self.is_processing = True
+                self._processing_event.set()
                 
             except Exception as e:
                 self.update_status(f"Error starting watcher: {str(e)}", "error")
@@ -588,65 +808,130 @@ class Iso2GodGUI:
         else:
             self.stop_watching()
 
+    def scan_existing(self, watch_dir):
+        try:
+            # scandir folds the is_file check into the directory read - one
+            # syscall per entry instead of a listdir + stat pair
+            with os.scandir(watch_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(('.iso', '.ISO')):
+                        self.handler.on_created(FileCreatedEvent(entry.path))
+        except Exception as e:
+            self.update_status(f"Error scanning watch directory: {e}", "error")
+
     def stop_watching(self):
         if self.watcher:
             try:
                 self.watcher.stop()
+                self.watcher.join()
+                if self.handler:
+                    self.handler.stop()
                 self.watcher = None
                 self.start_btn.configure(text="Start Conversion")
                 self.update_status("Stopped watching")
                 self.is_processing = False
+                self._processing_event.clear()
             except Exception as e:
                 self.update_status(f"Error stopping watcher: {str(e)}", "error")
                 messagebox.showerror("Error", f"Error stopping watcher: {str(e)}")
 
     def clear_queue(self):
-        while not self.iso_queue.empty():
-            try:
-                self.iso_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Only subtract what was actually removed: an in-flight conversion
+        # still bumps _completed when it finishes, so zeroing both counters
+        # here would skew them for the rest of the session
+        with self._count_lock:
+            removed = len(self.iso_deque)
+            self.iso_deque.clear()
+            self._enqueued -= removed
         self.update_status("Queue cleared")
 
+    FTP_RETRY_DELAY_MS = 5000
+    FTP_RETRY_LIMIT = 5
+
+    def _schedule_ftp_retry(self, attempt, error):
+        """Re-attempt a transfer that died on a (likely transient) network
+        error. The wait rides the Tk timer and the transfer itself runs on
+        the IO pool, so neither thread sits in a sleep."""
+        if attempt > self.FTP_RETRY_LIMIT:
+            self.update_status(f"FTP Transfer failed after {self.FTP_RETRY_LIMIT} retries: {error}", "error")
+            return
+        self.update_status(f"FTP Transfer Error: {error}. Retrying in 5 seconds... (Attempt {attempt}/{self.FTP_RETRY_LIMIT})", "error")
+        self.app.after(self.FTP_RETRY_DELAY_MS, lambda: self._io_pool.submit(self._retry_ftp, attempt))
+
+    def _retry_ftp(self, attempt):
+        try:
+            self.send_over_ftp()
+        except _FTP_ERRORS as e:
+            self._schedule_ftp_retry(attempt + 1, e)
+
+    def _on_iso_deleted(self, filename, fut):
+        err = fut.exception()
+        if err is None:
+            self.update_status(f"Deleted original ISO: {filename}", "success")
+        else:
+            self.update_status(f"Error deleting ISO {filename}: {err}", "error")
+
+    def _on_status_event(self, event=None):
+        """Drain conversion output accumulated by the reader threads.
+
+        Dense "writing part files:" bursts are coalesced: only the newest
+        one reaches the status label, skipping the stale redraws.
+        """
+        last_part_line = None
+        try:
+            while True:
+                line, is_error = self._log_q.get_nowait()
+                if "writing part files:" in line:
+                    last_part_line = line
+                    continue
+                self.update_status(line, "error" if is_error else None)
+        except queue.Empty:
+            pass
+        if last_part_line is not None:
+            self.status_label.configure(text=f"Status: {last_part_line}")
+
+    def _enqueue_iso(self, path):
+        with self._count_lock:
+            self._enqueued += 1
+        self.iso_deque.append(path)
+        self.iso_event.set()
+
     def process_queue(self):
         while True:
-            if self.is_processing:
-                try:
-                    total_count = self.iso_queue.qsize()
-                    if total_count == 0:
-                        time.sleep(0.1)
-                        continue
-                    # Calculate the current index (1-based)
-                    current_index = total_count - self.iso_queue.qsize() + 1
-                    iso_path = self.iso_queue.get(timeout=1)
-                    self.process_iso(iso_path, current_index=current_index, total_count=total_count)
-                except queue.Empty:
-                    time.sleep(0.1)
-            else:
-                time.sleep(0.1)
+            # Block until watching is active and work arrives, instead of
+            # polling at 10Hz; Stop Watching parks the loop here
+            self._processing_event.wait()
+            self.iso_event.wait()
+            if not self._processing_event.is_set():
+                continue
+            try:
+                iso_path = self.iso_deque.popleft()
+            except IndexError:
+                self.iso_event.clear()
+                # Re-check after clearing: a producer may have appended (and
+                # set the event) between our failed pop and the clear, and
+                # that item must not wait for a future wakeup
+                if self.iso_deque:
+                    self.iso_event.set()
+                continue
+            with self._count_lock:
+                current_index = self._completed + 1
+                total_count = self._enqueued
+            self.process_iso(iso_path, current_index=current_index, total_count=total_count)
+            with self._count_lock:
+                self._completed += 1
 
     def process_iso(self, iso_path, current_index=None, total_count=None):
         max_retries = 3  # Maximum number of retry attempts
         retry_delay = 120  # Delay between retries in seconds
         current_try = 0
-        last_progress_time = 0  # Track last progress update
         progress_update_interval = 10  # Update every 10 seconds
-        # --- v1.6.0 and below edge case support ---
-        def is_legacy_version(binary_name):
-            import re
-            m = re.search(r'-(\d+\.\d+\.\d+)', binary_name)
-            if m:
-                version = m.group(1)
-                # Compare as tuple of ints
-                version_tuple = tuple(map(int, version.split('.')))
-                return version_tuple <= (1, 6, 0)
-            return False
-        # --- end legacy support ---
         try:
             # Update the current game title display
             filename = os.path.basename(iso_path)
             game_title = os.path.splitext(filename)[0]
-            self.game_title_var.set(game_title)
+            # Tk variables are Tcl calls too - set them from the main loop
+            self.app.after(0, self.game_title_var.set, game_title)
             self.update_status(f"Found new ISO: {filename}", "found", current_index=current_index, total_count=total_count)
             # Get the path to iso2god binary from selection
             iso2god_binary = self.selected_iso2god.get()
@@ -657,111 +942,233 @@ class Iso2GodGUI:
             if not os.path.exists(iso2god_path):
                 self.update_status(f"iso2god binary not found: {iso2god_path}", "error")
                 return
-            legacy_mode = is_legacy_version(iso2god_binary)
+            legacy_mode = _is_legacy_version(iso2god_binary)
+            # Everything that can't change between retries is read once here,
+            # so e.g. an invalid timeout is reported once rather than per
+            # attempt
+            output_dir = self.output_path.get()
+            trim = self.trim_var.get()
+            thread_count = self.thread_count.get()
+            # Get timeout value in minutes (0 means no timeout)
+            try:
+                timeout_minutes = float(self.process_timeout.get())
+                timeout_seconds = timeout_minutes * 60 if timeout_minutes > 0 else None
+            except ValueError:
+                timeout_seconds = None
+                self.update_status("Invalid timeout value, proceeding without timeout", "error")
             while current_try < max_retries:
                 try:
-                    # Check if file is accessible before attempting conversion
+                    # Check the file is settled before attempting conversion
                     try:
-                        with open(iso_path, 'rb') as test_file:
-                            pass
+                        _check_iso_ready(iso_path)
                     except PermissionError:
                         if current_try < max_retries - 1:
                             self.update_status(f"File {filename} is locked. Retrying in {retry_delay} seconds... (Attempt {current_try + 1}/{max_retries})", "error", current_index=current_index, total_count=total_count)
-                            time.sleep(retry_delay)
+                            if self._stop_event.wait(retry_delay):
+                                return
                             current_try += 1
                             continue
                         else:
                             self.update_status(f"Skipping {filename} - File remained locked after {max_retries} attempts", "error", current_index=current_index, total_count=total_count)
                             return
-                    cmd = [iso2god_path, iso_path, self.output_path.get()]
+                    cmd = [iso2god_path, iso_path, output_dir]
                     # Add optional arguments
-                    if self.trim_var.get():
+                    if trim:
                         cmd.append("--trim")
-                    thread_count = self.thread_count.get()
                     # Only add -j if not legacy
                     add_j = thread_count.isdigit() and not legacy_mode
                     if add_j:
                         cmd.extend(["-j", thread_count])
-                    # Get timeout value in minutes (0 means no timeout)
-                    try:
-                        timeout_minutes = float(self.process_timeout.get())
-                        timeout_seconds = timeout_minutes * 60 if timeout_minutes > 0 else None
-                    except ValueError:
-                        timeout_seconds = None
-                        self.update_status("Invalid timeout value, proceeding without timeout", "error")
                     self.update_status(f"Starting conversion of {filename}...", current_index=current_index, total_count=total_count)
+                    popen_kwargs = {}
+                    if os.name == 'posix':
+                        # Own session, so the timeout branch can signal the
+                        # whole group (child plus any helpers it spawned)
+                        popen_kwargs['start_new_session'] = True
+                    elif os.name == 'nt':
+                        # Skip the console-window allocation (and its visible
+                        # flash) for every converted ISO
+                        popen_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
                     process = subprocess.Popen(
                         cmd,
                         stdout=subprocess.PIPE,
                         stderr=subprocess.PIPE,
-                        text=True,
-                        bufsize=1  # Line buffered
+                        bufsize=65536,
+                        **popen_kwargs
                     )
-                    # Store the last output line for progress updates
+                    # Store the last output line for progress updates, plus a
+                    # reader-owned flag so the progress tick tests a bool
+                    # instead of re-scanning the line
                     last_output = ""
+                    last_is_part = [False]
                     conversion_start_time = time.time()
-                    # Use separate thread for reading output to prevent blocking
-                    error_detected = {"unexpected_j": False}
-                    def read_output(pipe, is_error=False):
+                    # Readers signal this once both pipes hit EOF, so the
+                    # worker blocks on the event instead of polling poll()
+                    done_event = threading.Event()
+                    eof_lock = threading.Lock()
+                    eof_count = [0]
+                    def mark_eof():
+                        with eof_lock:
+                            eof_count[0] += 1
+                            if eof_count[0] == len(reader_threads):
+                                done_event.set()
+                    # Reads pull 64 KiB chunks and split on newlines in one
+                    # pass, so a fast-emitting child costs a handful of
+                    # syscalls per burst instead of one per line.
+                    error_detected = {"unexpected_j": False, "permission": None}
+                    # The readers are daemon threads that can outlive an
+                    # early window close; holding self only through a weak
+                    # proxy lets the Tk root and its state be collected
+                    # instead of being pinned by a half-finished conversion
+                    wself = weakref.proxy(self)
+                    def consume_chunk(state, chunk, is_error):
                         nonlocal last_output
-                        while True:
-                            line = pipe.readline()
-                            if not line:
-                                break
-                            line = line.strip()
-                            if line:
+                        if not chunk:
+                            lines = [state['buf']] if state['buf'].strip() else []
+                            state['buf'] = b""
+                        else:
+                            state['buf'] += chunk
+                            *lines, state['buf'] = state['buf'].split(b'\n')
+                        batch = [l for l in (raw.strip() for raw in lines) if l]
+                        if not batch:
+                            return
+                        if is_error:
+                            joined = b'\n'.join(batch)
+                            for m in _MARKER_RE.finditer(joined):
                                 # --- legacy error detection ---
-                                if is_error and legacy_mode and "unexpected argument '-j' found" in line:
+                                if m.lastgroup == 'j' and legacy_mode:
                                     error_detected["unexpected_j"] = True
-                                # --- end legacy error detection ---
-                                # Check for file access errors in the output
-                                if is_error and ("process cannot access the file" in line or 
-                                               "being used by another process" in line):
-                                    raise PermissionError(line)
-                                # Update progress immediately for part file updates
-                                if "writing part files:" in line:
-                                    self.status_label.configure(text=f"Status: {line}")
-                                    self.app.update_idletasks()
-                                self.update_status(line, "error" if is_error else None)
-                                if not is_error:
-                                    last_output = line
-                                # Keep GUI responsive
-                                self.app.update_idletasks()
-                    # Start output reader threads
-                    stdout_thread = threading.Thread(target=read_output, args=(process.stdout,))
-                    stderr_thread = threading.Thread(target=read_output, args=(process.stderr, True))
-                    stdout_thread.daemon = True
-                    stderr_thread.daemon = True
-                    stdout_thread.start()
-                    stderr_thread.start()
-                    # Wait for process with optional timeout and progress updates
-                    while process.poll() is None:
-                        current_time = time.time()
-                        # Check for timeout
-                        if timeout_seconds and current_time - conversion_start_time > timeout_seconds:
-                            process.terminate()
-                            time.sleep(1)
-                            if process.poll() is None:
-                                process.kill()
-                            self.update_status(f"Skipping {filename} - Process timed out after {timeout_minutes} minutes", "error", current_index=current_index, total_count=total_count)
+                                # Recorded rather than raised so the retry
+                                # logic on the worker thread sees the full
+                                # offending line
+                                elif m.lastgroup == 'perm':
+                                    start = joined.rfind(b'\n', 0, m.start()) + 1
+                                    end = joined.find(b'\n', m.end())
+                                    if end == -1:
+                                        end = len(joined)
+                                    error_detected["permission"] = joined[start:end].decode(errors="replace")
+                        # Decode once per batch; only the last logical line
+                        # is surfaced, earlier ones were already scanned for
+                        # markers above
+                        line = batch[-1].decode(errors="replace")
+                        try:
+                            wself._log_q.put_nowait((line, is_error))
+                            if not is_error:
+                                last_output = line
+                                last_is_part[0] = b"writing part files:" in batch[-1]
+                            # event_generate with when="tail" is safe from
+                            # threads; the bound handler drains the queue on
+                            # the main loop
+                            wself.app.event_generate("<<StatusUpdate>>", when="tail")
+                        except ReferenceError:
+                            return  # GUI already torn down
+                        except tk.TclError:
+                            pass  # window being torn down
+                    def pump_pipes():
+                        # One thread multiplexes both pipes with select()
+                        sel = selectors.DefaultSelector()
+                        states = {}
+                        for pipe, is_error in ((process.stdout, False), (process.stderr, True)):
+                            sel.register(pipe, selectors.EVENT_READ, data=is_error)
+                            states[pipe.fileno()] = {'buf': b""}
+                        while states:
+                            # No timeout: EOF shows up as a readable event,
+                            # so there is nothing to wake up for in between
+                            for key, _ in sel.select():
+                                fd = key.fileobj.fileno()
+                                try:
+                                    chunk = os.read(fd, 65536)
+                                except OSError:
+                                    chunk = b""
+                                consume_chunk(states[fd], chunk, key.data)
+                                if not chunk:
+                                    sel.unregister(key.fileobj)
+                                    del states[fd]
+                        sel.close()
+                        mark_eof()
+                    def read_pipe(pipe, is_error):
+                        state = {'buf': b""}
+                        fd = pipe.fileno()
+                        while True:
+                            try:
+                                chunk = os.read(fd, 65536)
+                            except OSError:
+                                chunk = b""
+                            consume_chunk(state, chunk, is_error)
+                            if not chunk:
+                                break
+                        mark_eof()
+                    if os.name == 'posix':
+                        reader_threads = [threading.Thread(target=pump_pipes, daemon=True)]
+                    else:
+                        # Windows can't select() on pipes, so it keeps one
+                        # reader thread per pipe
+                        reader_threads = [
+                            threading.Thread(target=read_pipe, args=(process.stdout, False), daemon=True),
+                            threading.Thread(target=read_pipe, args=(process.stderr, True), daemon=True),
+                        ]
+                    for reader in reader_threads:
+                        reader.start()
+                    # Elapsed-time updates ride the Tk timer wheel; the
+                    # callback re-arms itself until the conversion finishes
+                    progress_state = {'after_id': None}
+                    # Constant prefix built once rather than per tick
+                    converting_prefix = f"Converting {filename} - Time elapsed: "
+                    def tick_progress():
+                        if done_event.is_set():
+                            progress_state['after_id'] = None
                             return
-                        # Only show elapsed time if we haven't seen a progress update recently
-                        if current_time - last_progress_time >= progress_update_interval and not "writing part files:" in last_output:
-                            elapsed_minutes = (current_time - conversion_start_time) / 60
+                        if not last_is_part[0]:
+                            elapsed_minutes = (time.time() - conversion_start_time) / 60
                             self.update_status(
-                                f"Converting {filename} - "
-                                f"Time elapsed: {int(elapsed_minutes)} minutes - "
+                                f"{converting_prefix}{int(elapsed_minutes)} minutes - "
                                 f"Last status: {last_output}", current_index=current_index, total_count=total_count
                             )
-                            last_progress_time = current_time
-                        # Keep GUI responsive without consuming CPU
-                        self.app.update()
-                        time.sleep(0.1)  # Small sleep to prevent CPU spinning
+                            interval = progress_update_interval
+                        else:
+                            # Part-file output is already driving the status
+                            # label, so the elapsed-time tick can idle longer
+                            interval = progress_update_interval * 3
+                        progress_state['after_id'] = self.app.after(interval * 1000, tick_progress)
+                    progress_state['after_id'] = self.app.after(progress_update_interval * 1000, tick_progress)
+                    # Wait for EOF on both pipes, with optional timeout
+                    finished = done_event.wait(timeout_seconds)
+                    if not finished:
+                        # On POSIX the child leads its own process group, so
+                        # signal the group - terminate() alone would orphan
+                        # any helpers the child spawned
+                        if os.name == 'posix':
+                            try:
+                                os.killpg(process.pid, signal.SIGTERM)
+                            except ProcessLookupError:
+                                pass
+                        else:
+                            process.terminate()
+                        try:
+                            # Returns as soon as the child obeys the TERM
+                            # instead of always sleeping a full second
+                            process.wait(timeout=1)
+                        except subprocess.TimeoutExpired:
+                            if os.name == 'posix':
+                                try:
+                                    os.killpg(process.pid, signal.SIGKILL)
+                                except ProcessLookupError:
+                                    pass
+                            else:
+                                process.kill()
+                            process.wait()
+                        done_event.wait(5)  # readers exit once the pipes close
+                        self.update_status(f"Skipping {filename} - Process timed out after {timeout_minutes} minutes", "error", current_index=current_index, total_count=total_count)
+                        return
                     # Get final return code
-                    return_code = process.poll()
-                    # Wait for output threads to finish
-                    stdout_thread.join(1)
-                    stderr_thread.join(1)
+                    return_code = process.wait()
+                    # The readers are guaranteed to finish once the child's
+                    # pipes close, so join without a cap - a capped join
+                    # could truncate the error tail that decides retries
+                    for reader in reader_threads:
+                        reader.join()
+                    if error_detected["permission"]:
+                        raise PermissionError(error_detected["permission"])
                     # --- legacy retry logic ---
                     if legacy_mode and error_detected["unexpected_j"] and add_j:
                         self.update_status("Detected '-j' error for legacy iso2god. Retrying without '-j'...", "error", current_index=current_index, total_count=total_count)
@@ -770,20 +1177,24 @@ class Iso2GodGUI:
                         continue  # Retry without -j
                     # --- end legacy retry logic ---
                     if return_code == 0:
+                        # Snapshot once - each .get() on a Tk variable is a
+                        # Tcl round trip
+                        delete_iso = self.delete_iso_var.get()
+                        still_processing = self.is_processing
                         elapsed_minutes = (time.time() - conversion_start_time) / 60
                         self.update_status(
                             f"Successfully converted: {filename} "
-                            f"(Total time: {int(elapsed_minutes)} minutes)", 
+                            f"(Total time: {int(elapsed_minutes)} minutes)",
                             "success", current_index=current_index, total_count=total_count
                         )
                         # Delete the original ISO if option is enabled and still processing
-                        if self.delete_iso_var.get() and self.is_processing:
-                            try:
-                                os.remove(iso_path)
-                                self.update_status(f"Deleted original ISO: {filename}", "success", current_index=current_index, total_count=total_count)
-                            except Exception as e:
-                                self.update_status(f"Error deleting ISO {filename}: {str(e)}", "error", current_index=current_index, total_count=total_count)
-                        elif self.delete_iso_var.get() and not self.is_processing:
+                        if delete_iso and still_processing:
+                            # Deleting a multi-GB ISO can block on metadata
+                            # flushes or AV hooks; hand it to the IO pool so
+                            # the queue moves on immediately
+                            fut = self._io_pool.submit(os.remove, iso_path)
+                            fut.add_done_callback(functools.partial(self._on_iso_deleted, filename))
+                        elif delete_iso and not still_processing:
                             self.update_status(f"ISO not deleted because processing was stopped: {filename}", current_index=current_index, total_count=total_count)
                         else:
                             self.update_status(f"ISO kept (delete option disabled): {filename}", current_index=current_index, total_count=total_count)
@@ -792,7 +1203,8 @@ class Iso2GodGUI:
                         error_msg = f"Error converting {filename}: Process returned {return_code}"
                         if current_try < max_retries - 1:
                             self.update_status(f"{error_msg}. Retrying in {retry_delay} seconds... (Attempt {current_try + 1}/{max_retries})", "error", current_index=current_index, total_count=total_count)
-                            time.sleep(retry_delay)
+                            if self._stop_event.wait(retry_delay):
+                                return
                             current_try += 1
                         else:
                             self.update_status(f"Skipping {filename} - {error_msg} after {max_retries} attempts", "error", current_index=current_index, total_count=total_count)
@@ -800,7 +1212,8 @@ class Iso2GodGUI:
                 except PermissionError as e:
                     if current_try < max_retries - 1:
                         self.update_status(f"File access error: {str(e)}. Retrying in {retry_delay} seconds... (Attempt {current_try + 1}/{max_retries})", "error", current_index=current_index, total_count=total_count)
-                        time.sleep(retry_delay)
+                        if self._stop_event.wait(retry_delay):
+                            return
                         current_try += 1
                     else:
                         self.update_status(f"Skipping {filename} - File access error after {max_retries} attempts: {str(e)}", "error", current_index=current_index, total_count=total_count)
@@ -810,17 +1223,20 @@ class Iso2GodGUI:
                     return
         finally:
             # Always clean up, regardless of success or failure
-            self.game_title_var.set("None")  # Reset the game title display
-            if iso_path in self.handler.processing:
-                self.handler.processing.remove(iso_path)
-            self.iso_queue.task_done()
+            self.app.after(0, self.game_title_var.set, "None")  # Reset the game title display
+            self.handler.processing.discard(iso_path)
             if self.use_ftp.get():
-                if current_index == total_count:
+                # Decide from live queue state: counter comparisons can be
+                # skewed by a mid-flight Clear Queue and would then never
+                # trigger the end-of-queue transfer again
+                if not self.iso_deque:
                     try:
                         self.update_status("FTP Transfer: Yes")
                         self.send_over_ftp()
-                    except:
-                        self.update_status("FTP Transfer Error.")
+                    except _FTP_ERRORS as e:
+                        # A transient network blip shouldn't cost the
+                        # just-converted output; retry on a timer
+                        self._schedule_ftp_retry(1, e)
             else:
                 self.update_status("FTP Transfer: No")
 
@@ -832,9 +1248,22 @@ class Iso2GodGUI:
 
     def on_closing(self):
         try:
+            # Release any worker sitting in a retry backoff
+            self._stop_event.set()
+            # Flush any debounced save before quitting
+            if self._save_after_id:
+                self.app.after_cancel(self._save_after_id)
+                self._save_after_id = None
             self.save_config()
             if self.watcher:
                 self.stop_watching()
+            if self._ftp_conn is not None:
+                try:
+                    self._ftp_conn.quit()
+                except Exception:
+                    pass
+                self._ftp_conn = None
+            self._io_pool.shutdown(wait=False)
             self.app.quit()
         except Exception as e:
             print(f"Error during shutdown: {e}")